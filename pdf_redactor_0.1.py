@@ -12,8 +12,12 @@ See the GNU Affero General Public License for more details.
 """
 
 
+import bisect
 import os
 import re
+import time
+import unicodedata
+from array import array
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from PIL import Image, ImageTk
@@ -27,6 +31,25 @@ except ImportError:
 APP_TITLE = "El Tutos PDF Redactor"
 GITHUB_URL = "https://github.com/bili123/ElTutosPDFRedactor"
 
+# Layout fingerprints: box coordinates (PDF units) are snapped to this grid
+LAYOUT_GRID = 2.0
+# ... and compared within this distance (PDF units) around the drawn rect
+LAYOUT_MARGIN = 24.0
+# Share of look-alike pages a key must appear on to count as structure
+LAYOUT_MIN_SHARE = 0.5
+
+# Background passes (rendering, indexing) work in slices of this many seconds
+BACKGROUND_SLICE = 0.03
+
+# Thumbnail strip
+THUMB_W = 96        # thumbnail width in px
+THUMB_PAD = 8       # gap around thumbnails in px
+THUMB_LABEL_H = 14  # room for the page number below each thumbnail
+
+# Text stream normalization
+HYPHENS = ("-", "\u2010")
+SOFT_HYPHEN = "\u00ad"
+
 
 class PDFRedactorGUI:
     def __init__(self, root: tk.Tk):
@@ -42,12 +65,14 @@ class PDFRedactorGUI:
             "dark": {
                 "canvas_bg": "gray20",
                 "page_border": "gray60",
+                "thumb_fg": "gray85",
                 "ui_bg": None,     # let tk default
                 "ui_fg": None,
             },
             "light": {
                 "canvas_bg": "white",
                 "page_border": "gray50",
+                "thumb_fg": "black",
                 "ui_bg": None,
                 "ui_fg": None,
             }
@@ -60,7 +85,7 @@ class PDFRedactorGUI:
         self.redactions = {}  # {page_index: [fitz.Rect, ...]}
 
         # Rendered pages
-        self.page_imgs = []    # ImageTk references
+        self.page_imgs = {}    # {page_index: ImageTk or None if rendering failed}
         self.page_sizes = []   # (w, h) in px
         self.page_scales = []  # px per PDF unit
 
@@ -73,6 +98,26 @@ class PDFRedactorGUI:
         self.drag_page = None    # page index
         self.current_rect_item = None
 
+        # Thumbnails: rendered in small chunks via after(), drawn only when visible
+        self.thumb_imgs = {}   # {page_index: ImageTk or None if rendering failed} cache
+        self.thumb_tops = []   # y of each thumbnail slot in strip px
+        self.thumb_heights = []
+        self._thumb_next = 0   # next page for the background pass
+        self._thumb_after_id = None
+
+        # Per-document caches for "apply to similar pages"
+        self._words_cache = {}     # {page_index: get_text("words") result}
+        self._layout_pages = None  # [[(key, bbox, movable), ...], ...] per page
+        self._layout_sizes = None  # [page size key, ...]
+        self._layout_index = None  # {key: set(page_index)}
+        self._layout_next = 0      # next page for the background indexing pass
+        self._layout_after_id = None
+        self._text_streams = {}    # {fold: (text, starts, ends, words)}, see _text_stream
+
+        # Full page rendering: in small chunks via after(), visible pages first
+        self._page_next = 0
+        self._page_after_id = None
+
         # Resize debounce
         self._resize_after_id = None
 
@@ -98,6 +143,7 @@ class PDFRedactorGUI:
         
         tk.Button(row1, text="Undo last (page)", command=self.undo_last).pack(side=tk.LEFT, padx=10, pady=4)
         tk.Button(row1, text="Clear page", command=self.clear_page).pack(side=tk.LEFT, padx=4, pady=4)
+        tk.Button(row1, text="Apply to similar pages", command=self.apply_to_similar_pages).pack(side=tk.LEFT, padx=10, pady=4)
         
         # --- Row 2: search + actions (includes Save/Info/Theme, always visible) ---
         sf = tk.Frame(row2)
@@ -109,7 +155,7 @@ class PDFRedactorGUI:
         self.search_entry.pack(side=tk.LEFT, padx=4)
         
         self.regex_var = tk.BooleanVar(value=False)
-        tk.Checkbutton(sf, text="Regex", variable=self.regex_var).pack(side=tk.LEFT, padx=6)
+        tk.Checkbutton(sf, text="Regex (case sensitive)", variable=self.regex_var).pack(side=tk.LEFT, padx=6)
         
         tk.Button(sf, text="Redact matches", command=self.redact_matches).pack(side=tk.LEFT, padx=4)
         
@@ -126,6 +172,21 @@ class PDFRedactorGUI:
         frame = tk.Frame(self.root)
         frame.pack(fill=tk.BOTH, expand=True)
         
+        # --- Thumbnail strip (left) ---
+        tf = tk.Frame(frame)
+        tf.pack(side=tk.LEFT, fill=tk.Y)
+        
+        self.thumbs = tk.Canvas(tf, width=THUMB_W + 2 * THUMB_PAD, highlightthickness=0)
+        self.thumbs_bar = tk.Scrollbar(tf, orient=tk.VERTICAL, command=self.thumbs.yview)
+        self.thumbs.configure(yscrollcommand=self._on_thumbs_yscroll)
+        self.thumbs.pack(side=tk.LEFT, fill=tk.Y)
+        self.thumbs_bar.pack(side=tk.LEFT, fill=tk.Y)
+        
+        self.thumbs.bind("<ButtonPress-1>", self.on_thumb_click)
+        self.thumbs.bind("<MouseWheel>", self._on_thumbs_mousewheel)
+        self.thumbs.bind("<Button-4>", self._on_thumbs_mousewheel)
+        self.thumbs.bind("<Button-5>", self._on_thumbs_mousewheel)
+        
         self.canvas = tk.Canvas(frame)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
@@ -168,7 +229,9 @@ class PDFRedactorGUI:
     def _apply_theme(self):
         t = self.themes[self.theme]
         self.canvas.configure(bg=t["canvas_bg"])
+        self.thumbs.configure(bg=t["canvas_bg"])
         self._redraw_everything()
+        self._draw_visible_thumbs()
 
     def toggle_theme(self):
         self.theme = "light" if self.theme == "dark" else "dark"
@@ -207,9 +270,14 @@ class PDFRedactorGUI:
             "A minimal, secure PDF redaction tool.\n\n"
             "Usage:\n"
             "• Open a PDF\n"
+            "• Click a thumbnail on the left to jump to its page\n"
             "• Draw black rectangles to mark redactions\n"
             "• Rectangles can be removed via right-click\n"
             "• Or search text / regex and redact matches\n"
+            "• Search finds text across line breaks and hyphenation, ignoring case\n"
+            "• Regex is case sensitive (use (?i) to ignore case); \".\" stops at line ends, \\s crosses them\n"
+            "• In a regex, ^ and $ match at the start and end of every line\n"
+            "• \"Apply to similar pages\" copies the last rectangle to pages with the same layout\n"
             "• Save to permanently remove redacted content\n\n"
             "Notes:\n"
             "• Redaction removes underlying text and images\n"
@@ -264,32 +332,107 @@ class PDFRedactorGUI:
 
         self.pdf_path = path
         self.redactions = {}
+        self._words_cache = {}
+        self._text_streams = {}
         self.current_page = 0
+
+        # thumbnails and full pages are rendered in the background
+        self._setup_thumbs()
         self._render_all_pages()
         self._relayout_only()
         self._scroll_to_page(0)
 
+        self._start_layout_index()
+
     def _render_all_pages(self):
-        """Render pixmaps once; layout is done separately."""
-        self.page_imgs = []
+        """
+        Compute page sizes now and start rendering pixmaps in the background;
+        layout is done separately and shows placeholders until a page is ready.
+        """
+        if self._page_after_id is not None:
+            self.root.after_cancel(self._page_after_id)
+            self._page_after_id = None
+
+        self.page_imgs = {}
         self.page_sizes = []
         self.page_scales = []
+        self._page_next = 0
 
+        mat = pymupdf.Matrix(self.zoom, self.zoom)
         for i in range(len(self.doc)):
             page = self.doc[i]
+            ir = (page.rect * mat).irect  # same size get_pixmap() will produce
+            self.page_sizes.append((ir.width, ir.height))
+            self.page_scales.append(ir.width / float(page.rect.width))
+
+        self._page_after_id = self.root.after(1, self._render_pages_step)
+
+    def _render_page(self, page_index):
+        try:
+            page = self.doc[page_index]
             mat = pymupdf.Matrix(self.zoom, self.zoom)
             pix = page.get_pixmap(matrix=mat, alpha=False)
 
             img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
             tk_img = ImageTk.PhotoImage(img)
+        except Exception:
+            # damaged page: keep the placeholder
+            self.page_imgs[page_index] = None
+            return
+
+        self.page_imgs[page_index] = tk_img
+
+        # replace the placeholder if the page is already laid out
+        if page_index < len(self.page_pos):
+            x, y = self.page_pos[page_index]
+            self.canvas.delete(f"ph{page_index}")
+            item = self.canvas.create_image(x, y, image=tk_img, anchor="nw", tags=("pageimg", f"p{page_index}"))
+            self.canvas.tag_lower(item)
+
+    def _visible_pages(self):
+        """Indices of pages currently in view on the main canvas."""
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(max(1, self.canvas.winfo_height()))
+        return [
+            i for i, (_, y) in enumerate(self.page_pos)
+            if y < bottom and y + self.page_sizes[i][1] > top
+        ]
+
+    def _background_slice(self, cursor_attr, after_attr, process, step, done=()):
+        """
+        Shared body of the background passes: process(i) for the pages from
+        the cursor on, skipping those in done, for BACKGROUND_SLICE seconds.
+        Reschedules step via root.after() while pages remain, so the event
+        loop gets to run between slices.
+        """
+        n = len(self.doc)
+        i = getattr(self, cursor_attr)
+        deadline = time.perf_counter() + BACKGROUND_SLICE
+        while i < n and time.perf_counter() < deadline:
+            if i not in done:
+                process(i)
+            i += 1
+        setattr(self, cursor_attr, i)
+
+        if i < n:
+            setattr(self, after_attr, self.root.after(1, step))
+
+    def _render_pages_step(self):
+        """Page rendering pass: pages in view first, then the next slice in order."""
+        self._page_after_id = None
+        if not self.doc:
+            return
+
+        for i in self._visible_pages():
+            if i not in self.page_imgs:
+                self._render_page(i)
 
-            self.page_imgs.append(tk_img)
-            self.page_sizes.append((pix.width, pix.height))
-            self.page_scales.append(pix.width / float(page.rect.width))
+        self._background_slice("_page_next", "_page_after_id", self._render_page,
+                               self._render_pages_step, done=self.page_imgs)
 
     def _relayout_only(self):
         """Recompute page positions and redraw canvas items without re-rendering pixmaps."""
-        if not self.doc or not self.page_imgs:
+        if not self.doc or not self.page_sizes:
             return
 
         self.canvas.delete("all")
@@ -315,8 +458,12 @@ class PDFRedactorGUI:
 
             self.page_pos.append((x, y))
 
-            # page image
-            self.canvas.create_image(x, y, image=self.page_imgs[i], anchor="nw", tags=("pageimg", f"p{i}"))
+            # page image, or a placeholder until it is rendered
+            img = self.page_imgs.get(i)
+            if img is not None:
+                self.canvas.create_image(x, y, image=img, anchor="nw", tags=("pageimg", f"p{i}"))
+            else:
+                self.canvas.create_rectangle(x, y, x + w, y + h, fill="gray40", outline="", tags=("pageph", f"ph{i}"))
 
             # border
             self.canvas.create_rectangle(
@@ -336,6 +483,137 @@ class PDFRedactorGUI:
         self._redraw_all_redactions()
         self._update_page_label()
 
+    # ---------------- Thumbnail strip ----------------
+    def _setup_thumbs(self):
+        """Compute thumbnail slots, render the visible ones and start the background pass."""
+        if self._thumb_after_id is not None:
+            self.root.after_cancel(self._thumb_after_id)
+            self._thumb_after_id = None
+
+        self.thumb_imgs = {}
+        self.thumb_tops = []
+        self.thumb_heights = []
+        self._thumb_next = 0
+
+        y = THUMB_PAD
+        for i in range(len(self.doc)):
+            r = self.doc[i].rect
+            h = max(1, int(THUMB_W * r.height / float(r.width)))
+            self.thumb_tops.append(y)
+            self.thumb_heights.append(h)
+            y += h + THUMB_LABEL_H + THUMB_PAD
+
+        self.thumbs.config(scrollregion=(0, 0, THUMB_W + 2 * THUMB_PAD, y))
+        self.thumbs.yview_moveto(0)
+        self._render_thumbs_step()
+
+    def _render_thumb(self, page_index):
+        try:
+            page = self.doc[page_index]
+            s = THUMB_W / float(page.rect.width)
+            pix = page.get_pixmap(matrix=pymupdf.Matrix(s, s), alpha=False)
+
+            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+            tk_img = ImageTk.PhotoImage(img)
+        except Exception:
+            # damaged page: keep the placeholder
+            tk_img = None
+
+        self.thumb_imgs[page_index] = tk_img
+
+    def _render_thumbs_step(self):
+        """Thumbnail pass: thumbnails in view first, then the next slice in order; redraws the strip."""
+        self._thumb_after_id = None
+        if not self.doc:
+            return
+
+        first, last = self._visible_thumb_range()
+        for i in range(first, last + 1):
+            if i not in self.thumb_imgs:
+                self._render_thumb(i)
+
+        self._background_slice("_thumb_next", "_thumb_after_id", self._render_thumb,
+                               self._render_thumbs_step, done=self.thumb_imgs)
+        self._draw_visible_thumbs()
+
+    def _visible_thumb_range(self):
+        """First and last page index whose thumbnail slot is in view."""
+        if not self.thumb_tops:
+            return 0, -1
+        top = self.thumbs.canvasy(0)
+        bottom = self.thumbs.canvasy(max(1, self.thumbs.winfo_height()))
+        first = max(0, bisect.bisect_right(self.thumb_tops, top) - 1)
+        last = max(first, bisect.bisect_right(self.thumb_tops, bottom) - 1)
+        return first, min(last, len(self.thumb_tops) - 1)
+
+    def _draw_visible_thumbs(self):
+        """Virtual drawing: only items for thumbnails in view exist on the strip."""
+        self.thumbs.delete("all")
+        if not self.doc or not self.thumb_tops:
+            return
+
+        t = self.themes[self.theme]
+        x = THUMB_PAD
+        first, last = self._visible_thumb_range()
+
+        for i in range(first, last + 1):
+            y = self.thumb_tops[i]
+            h = self.thumb_heights[i]
+
+            img = self.thumb_imgs.get(i)
+            if img is not None:
+                self.thumbs.create_image(x, y, image=img, anchor="nw")
+            else:
+                self.thumbs.create_rectangle(x, y, x + THUMB_W, y + h, fill="gray40", outline="")
+
+            # border, highlighted for the current page
+            if i == self.current_page:
+                self.thumbs.create_rectangle(x - 2, y - 2, x + THUMB_W + 2, y + h + 2, outline="dodgerblue", width=3)
+            else:
+                self.thumbs.create_rectangle(x, y, x + THUMB_W, y + h, outline=t["page_border"], width=1)
+
+            # marker for pages with redactions
+            if self.redactions.get(i):
+                self.thumbs.create_rectangle(
+                    x + THUMB_W - 14, y + 4, x + THUMB_W - 4, y + 14,
+                    fill="red", outline="black"
+                )
+
+            self.thumbs.create_text(x + THUMB_W / 2, y + h + 1, text=str(i + 1), anchor="n", fill=t["thumb_fg"])
+
+    def _on_thumbs_yscroll(self, first, last):
+        self.thumbs_bar.set(first, last)
+        self._draw_visible_thumbs()
+
+    def _on_thumbs_mousewheel(self, event):
+        if event.num == 4:
+            self.thumbs.yview_scroll(-1, "units")
+        elif event.num == 5:
+            self.thumbs.yview_scroll(1, "units")
+        else:
+            self.thumbs.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        return "break"  # don't scroll the page canvas too
+
+    def _thumbs_see(self, page_index):
+        """Scroll the strip so the given page's thumbnail is visible."""
+        if not self.thumb_tops:
+            return
+        first, last = self._visible_thumb_range()
+        if first < page_index < last:
+            return
+        sr = self.thumbs.cget("scrollregion")
+        if not sr:
+            return
+        total_h = max(1.0, float(sr.split()[3]))
+        self.thumbs.yview_moveto(max(0, self.thumb_tops[page_index] - THUMB_PAD) / total_h)
+
+    def on_thumb_click(self, event):
+        if not self.doc or not self.thumb_tops:
+            return
+        y = self.thumbs.canvasy(event.y)
+        i = max(0, bisect.bisect_right(self.thumb_tops, y) - 1)
+        self._scroll_to_page(min(i, len(self.doc) - 1))
+
     def _redraw_everything(self):
         # used on theme change
         if not self.doc:
@@ -353,7 +631,9 @@ class PDFRedactorGUI:
             return
         page_index = max(0, min(page_index, len(self.doc) - 1))
         self.current_page = page_index
+        self._thumbs_see(page_index)
         self._update_page_label()
+        self._draw_visible_thumbs()  # current page highlight
 
         if not self.page_pos:
             return
@@ -376,6 +656,11 @@ class PDFRedactorGUI:
             self._scroll_to_page(self.current_page + 1)
 
     # ---------------- Redaction overlay rendering ----------------
+    def _redactions_changed(self):
+        """Call after editing self.redactions: redraws the overlay and the thumbnail markers."""
+        self._redraw_all_redactions()
+        self._draw_visible_thumbs()
+
     def _redraw_all_redactions(self):
         self.canvas.delete("redaction")
 
@@ -456,13 +741,13 @@ class PDFRedactorGUI:
         if rects:
             rects.pop()
             self.redactions[self.current_page] = rects
-            self._redraw_all_redactions()
+            self._redactions_changed()
 
     def clear_page(self):
         if not self._ensure_loaded():
             return
         self.redactions[self.current_page] = []
-        self._redraw_all_redactions()
+        self._redactions_changed()
 
     def on_right_click_delete(self, event):
         """Right-click a rectangle to delete it."""
@@ -491,7 +776,7 @@ class PDFRedactorGUI:
         if 0 <= idx < len(rects):
             rects.pop(idx)
             self.redactions[p] = rects
-            self._redraw_all_redactions()
+            self._redactions_changed()
 
     # ---------------- Drawing ----------------
     def on_mouse_down(self, event):
@@ -506,6 +791,7 @@ class PDFRedactorGUI:
 
         self.current_page = p
         self._update_page_label()
+        self._draw_visible_thumbs()  # current page highlight
 
         self.drag_start = (x, y)
         self.drag_page = p
@@ -544,7 +830,292 @@ class PDFRedactorGUI:
             return
 
         self.redactions.setdefault(self.current_page, []).append(r)
-        self._redraw_all_redactions()
+        self._redactions_changed()
+
+    # ---------------- Similar pages (layout fingerprints) ----------------
+    def _page_words(self, page_index):
+        """Words of a page, extracted once per document."""
+        words = self._words_cache.get(page_index)
+        if words is None:
+            words = self.doc[page_index].get_text("words")
+            self._words_cache[page_index] = words
+        return words
+
+    def _page_layout_items(self, page_index):
+        """
+        Cheap layout fingerprint of a page: (key, bbox, movable) for every word
+        and every path/image box. Keys are snapped to LAYOUT_GRID, word keys
+        include the text. Movable items (words, images) overlapping a drawn
+        rect are its content rather than page structure.
+        """
+        page = self.doc[page_index]
+        g = LAYOUT_GRID
+        items = []
+
+        for w in self._page_words(page_index):
+            key = ("word", w[4]) + tuple(round(v / g) for v in w[0:4])
+            items.append((key, tuple(w[0:4]), True))
+
+        try:
+            bboxlog = page.get_bboxlog()
+        except Exception:
+            # older PyMuPDF: words only
+            bboxlog = []
+        for kind, r in bboxlog:
+            if "text" in kind or "clip" in kind:
+                continue
+            key = (kind,) + tuple(round(v / g) for v in r)
+            items.append((key, tuple(r), "image" in kind or "imgmask" in kind))
+
+        return items
+
+    def _start_layout_index(self):
+        """Fingerprint all pages once per document in the background."""
+        if self._layout_after_id is not None:
+            self.root.after_cancel(self._layout_after_id)
+            self._layout_after_id = None
+
+        n = len(self.doc)
+        self._layout_pages = [None] * n
+        self._layout_sizes = [None] * n
+        self._layout_index = {}
+        self._layout_next = 0
+        self._layout_after_id = self.root.after(1, self._layout_index_step)
+
+    def _index_page(self, page_index):
+        g = LAYOUT_GRID
+        try:
+            items = self._page_layout_items(page_index)
+        except Exception:
+            # damaged page: nothing to match against
+            items = []
+        rect = self.doc[page_index].rect
+        size_key = ("page", round(rect.width / g), round(rect.height / g))
+
+        self._layout_pages[page_index] = items
+        self._layout_sizes[page_index] = size_key
+        self._layout_index.setdefault(size_key, set()).add(page_index)
+        for key, _bbox, _movable in items:
+            self._layout_index.setdefault(key, set()).add(page_index)
+
+    def _layout_index_step(self):
+        """Layout indexing pass: the next slice of pages in order."""
+        self._layout_after_id = None
+        if not self.doc:
+            return
+
+        self._background_slice("_layout_next", "_layout_after_id", self._index_page,
+                               self._layout_index_step)
+
+    def _region_signature(self, page_index, r):
+        """
+        (keys, filled) of a page around rect r.
+
+        keys holds the page size key and the keys of everything within
+        LAYOUT_MARGIN of r: labels, lines, boxes. Words and images overlapping
+        r are the values being redacted and differ from page to page, so they
+        only count through filled (is there anything at all inside r). A page
+        whose region is empty is skipped, unless the region on the page the
+        rect was drawn on is empty too.
+        """
+        m = LAYOUT_MARGIN
+        keys = {self._layout_sizes[page_index]}
+        filled = False
+        for key, (x0, y0, x1, y1), movable in self._layout_pages[page_index]:
+            if x0 > r.x1 + m or x1 < r.x0 - m or y0 > r.y1 + m or y1 < r.y0 - m:
+                continue
+            if movable and x0 < r.x1 and x1 > r.x0 and y0 < r.y1 and y1 > r.y0:
+                filled = True
+            else:
+                keys.add(key)
+        return keys, filled
+
+    def _similar_pages(self, page_index, r):
+        """
+        Pages (other than page_index) with the same structure around r,
+        among the pages indexed so far.
+
+        Neighbouring field values on a dense form fall within LAYOUT_MARGIN
+        too, so not every key around r is structure. Pages sharing at least
+        LAYOUT_MIN_SHARE of the keys around r are taken as the look-alikes;
+        only keys found on more than LAYOUT_MIN_SHARE of those count as
+        structure, on this page and on the candidates.
+        """
+        if self._layout_pages[page_index] is None:
+            self._index_page(page_index)
+
+        keys, filled = self._region_signature(page_index, r)
+
+        # look-alikes: pages sharing enough of the keys around r
+        counts = {}
+        for k in keys:
+            for p in self._layout_index[k]:
+                counts[p] = counts.get(p, 0) + 1
+        alike = {p for p, c in counts.items() if c >= LAYOUT_MIN_SHARE * len(keys)}
+
+        def is_structure(k):
+            pages = self._layout_index.get(k)
+            return pages is not None and len(pages & alike) > LAYOUT_MIN_SHARE * len(alike)
+
+        structure = {k for k in keys if is_structure(k)}
+        if len(structure) < 2:
+            # only the page size key: nothing to compare against
+            return None
+
+        # candidates must contain every key of the structure; start with the rarest
+        sets = sorted((self._layout_index[k] for k in structure), key=len)
+        candidates = set(sets[0])
+        for s in sets[1:]:
+            candidates &= s
+            if not candidates:
+                break
+        candidates.discard(page_index)
+
+        # and no other structure may be around the region
+        result = []
+        for p in sorted(candidates):
+            ckeys, cfilled = self._region_signature(p, r)
+            if (cfilled or not filled) and {k for k in ckeys if is_structure(k)} == structure:
+                result.append(p)
+        return result
+
+    def apply_to_similar_pages(self):
+        """Copy the last rectangle of the current page to all layout-identical pages."""
+        if not self._ensure_loaded():
+            return
+        rects = self.redactions.get(self.current_page, [])
+        if not rects:
+            messagebox.showinfo("Apply to similar pages", "Draw a rectangle on the current page first.")
+            return
+        r = rects[-1]
+
+        self.root.config(cursor="watch")
+        self.root.update_idletasks()
+        try:
+            pages = self._similar_pages(self.current_page, r)
+        except Exception as e:
+            messagebox.showerror("Apply to similar pages", str(e))
+            return
+        finally:
+            self.root.config(cursor="")
+
+        if pages is None:
+            messagebox.showinfo("Apply to similar pages", "No text or graphics around the rectangle to compare pages by.")
+            return
+
+        added = 0
+        for p in pages:
+            existing = self.redactions.setdefault(p, [])
+            if any(e == r for e in existing):
+                continue
+            existing.append(pymupdf.Rect(r))
+            added += 1
+
+        # the background pass may not be done yet: say how much was compared
+        n = len(self.doc)
+        indexed = sum(1 for items in self._layout_pages if items is not None)
+        note = ""
+        if indexed < n:
+            note = f"\n\nStill indexing: checked {indexed} of {n} pages. Run again later to cover the rest."
+
+        if added == 0:
+            messagebox.showinfo("Apply to similar pages", "No other pages with the same layout found." + note)
+        else:
+            self._redactions_changed()
+            messagebox.showinfo("Apply to similar pages", f"Added rectangle to {added} page(s)." + note)
+
+    # ---------------- Document text stream ----------------
+    def _normalize_text(self, text, fold):
+        """NFKC (ligatures, compatibility forms), no soft hyphens, optionally case folded."""
+        text = unicodedata.normalize("NFKC", text).replace(SOFT_HYPHEN, "")
+        return text.casefold() if fold else text
+
+    def _text_stream(self, fold):
+        """
+        Normalized text of the whole document, built once per document.
+
+        Returns (text, starts, ends, words): words[k] is (page_index, word)
+        and covers text[starts[k]:ends[k]]. Words on a line are joined by
+        single spaces. Line, block and page breaks are a space too in the
+        folded (plain search) stream, but a newline in the regex stream, so
+        that "." stops at the end of a line while "\\s" still crosses it.
+        In the folded stream only, a word ending in a hyphen at the end of a
+        line is joined to the next one; the hyphen is dropped if the next word
+        starts lowercase ("redac-" + "tion"). The regex stream keeps the hyphen
+        and the newline.
+        """
+        stream = self._text_streams.get(fold)
+        if stream is not None:
+            return stream
+
+        parts = []
+        starts = array("l")
+        ends = array("l")
+        words = []
+        pos = 0
+        sep = ""
+        line_sep = " " if fold else "\n"
+
+        for i in range(len(self.doc)):
+            pw = self._page_words(i)  # (x0,y0,x1,y1,"word",block,line,word_no)
+            for k, w in enumerate(pw):
+                token = self._normalize_text(w[4], fold)
+                if not token:
+                    continue
+
+                if words:
+                    parts.append(sep)
+                    pos += len(sep)
+                sep = " "
+
+                nxt = pw[k + 1] if k + 1 < len(pw) else None
+                if nxt is not None and (nxt[5], nxt[6]) != (w[5], w[6]):
+                    sep = line_sep
+                    # de-hyphenate for plain search only, the regex stream keeps the line break
+                    if fold and w[4].endswith(SOFT_HYPHEN):
+                        sep = ""
+                    elif fold and len(token) > 1 and token[-1] in HYPHENS and token[-2].isalpha():
+                        sep = ""
+                        if nxt[4][:1].islower():
+                            token = token[:-1]
+
+                starts.append(pos)
+                parts.append(token)
+                pos += len(token)
+                ends.append(pos)
+                words.append((i, w))
+
+            sep = line_sep
+
+        stream = ("".join(parts), starts, ends, words)
+        self._text_streams[fold] = stream
+        return stream
+
+    def _stream_matches_to_rects(self, stream, matches):
+        """Map (start, end) offsets in the stream to (page_index, rect), one rect per covered line."""
+        _, starts, ends, words = stream
+        for m0, m1 in matches:
+            if m1 <= m0:
+                continue
+
+            # words overlapping [m0, m1)
+            first = bisect.bisect_right(ends, m0)
+            last = bisect.bisect_left(starts, m1) - 1
+
+            key = None
+            r = None
+            for k in range(first, last + 1):
+                i, w = words[k]
+                line_key = (i, w[5], w[6])
+                if line_key != key:
+                    if r is not None:
+                        yield key[0], r
+                    key = line_key
+                    r = pymupdf.Rect(w[0:4])
+                else:
+                    r |= pymupdf.Rect(w[0:4])
+            if r is not None:
+                yield key[0], r
 
     # ---------------- Search / Regex redaction (tight boxes) ----------------
     def _tight_rect(self, page_index, r, pad_y_px=0):
@@ -573,32 +1144,14 @@ class PDFRedactorGUI:
         return rr
 
 
-    def _line_matches_to_rects(self, words, line_text, matches):
-        spans = []
-        pos = 0
-        for w in words:
-            token = w[4]
-            start = pos
-            end = pos + len(token)
-            spans.append((start, end, w))
-            pos = end + 1  # one space in reconstructed line_text
-
-        rects = []
-        for m0, m1 in matches:
-            covered = []
-            for s0, s1, w in spans:
-                if not (m1 <= s0 or m0 >= s1):  # overlap
-                    covered.append(w)
-
-            if covered:
-                r = pymupdf.Rect(covered[0][0:4])
-                for w in covered[1:]:
-                    r |= pymupdf.Rect(w[0:4])
-                rects.append(r)
-
-        return rects
-
     def redact_matches(self):
+        """
+        Search the normalized document text stream. Plain search is case
+        insensitive, regexes run case sensitive on NFKC text (use (?i) if needed).
+        Plain search matches across line, block and page breaks; in a regex
+        only whitespace classes like \\s do, "." stops at the end of a line
+        and ^/$ match at every line start/end (re.MULTILINE).
+        """
         if not self._ensure_loaded():
             return
         q = self.search_var.get().strip()
@@ -609,44 +1162,32 @@ class PDFRedactorGUI:
         do_regex = self.regex_var.get()
         added = 0
 
+        self.root.config(cursor="watch")
+        self.root.update_idletasks()
         try:
-            pattern = re.compile(q) if do_regex else None
-
-            for i in range(len(self.doc)):
-                page = self.doc[i]
-                words = page.get_text("words")  # (x0,y0,x1,y1,"word",block,line,word_no)
-
-                lines = {}
-                for w in words:
-                    key = (w[5], w[6])  # (block, line)
-                    lines.setdefault(key, []).append(w)
-
-                for lw in lines.values():
-                    lw.sort(key=lambda t: t[7])
-                    line_text = " ".join(w[4] for w in lw)
-
-                    if do_regex:
-                        ms = [(m.start(), m.end()) for m in pattern.finditer(line_text)]
-                    else:
-                        ms = []
-                        start = 0
-                        while True:
-                            j = line_text.find(q, start)
-                            if j < 0:
-                                break
-                            ms.append((j, j + len(q)))
-                            start = j + max(1, len(q))
-
-                    if not ms:
-                        continue
-
-                    rects = self._line_matches_to_rects(lw, line_text, ms)
-
-                    # keep tight; if needed change to pad_y_px=+1
-                    for r in rects:
-                        r2 = self._tight_rect(i, r, pad_y_px=-2)
-                        self.redactions.setdefault(i, []).append(r2)
-                        added += 1
+            if do_regex:
+                # lines are newline-separated in this stream: ^ and $ anchor per line, as before
+                pattern = re.compile(q, re.MULTILINE)
+                stream = self._text_stream(fold=False)
+                ms = [(m.start(), m.end()) for m in pattern.finditer(stream[0])]
+            else:
+                stream = self._text_stream(fold=True)
+                nq = " ".join(self._normalize_text(q, fold=True).split())
+                text = stream[0]
+                ms = []
+                start = 0
+                while nq:
+                    j = text.find(nq, start)
+                    if j < 0:
+                        break
+                    ms.append((j, j + len(nq)))
+                    start = j + len(nq)
+
+            # keep tight; if needed change to pad_y_px=+1
+            for i, r in self._stream_matches_to_rects(stream, ms):
+                r2 = self._tight_rect(i, r, pad_y_px=-2)
+                self.redactions.setdefault(i, []).append(r2)
+                added += 1
 
         except re.error as e:
             messagebox.showerror("Regex error", f"Invalid regex:\n{e}")
@@ -654,11 +1195,13 @@ class PDFRedactorGUI:
         except Exception as e:
             messagebox.showerror("Search error", str(e))
             return
+        finally:
+            self.root.config(cursor="")
 
         if added == 0:
             messagebox.showinfo("Redact matches", "No matches found.")
         else:
-            self._redraw_all_redactions()
+            self._redactions_changed()
             messagebox.showinfo("Redact matches", f"Added {added} redaction rectangle(s).")
 
     # ---------------- Save ----------------